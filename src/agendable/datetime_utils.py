@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, tzinfo
+from functools import lru_cache
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 
-def format_datetime_local_value(value: datetime, timezone_name: str | None) -> str:
-    dt_utc = value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
-
-    tz_name = (timezone_name or "UTC").strip() or "UTC"
-    target_zone: tzinfo
+@lru_cache(maxsize=1024)
+def get_zone(name: str) -> ZoneInfo | None:
+    # Unknown names are cached as None so repeat misses skip the tzdata search path.
     try:
-        target_zone = ZoneInfo(tz_name)
+        return ZoneInfo(name)
     except ZoneInfoNotFoundError:
-        target_zone = UTC
+        return None
+
 
-    return dt_utc.astimezone(target_zone).strftime("%Y-%m-%dT%H:%M")
+def zone_or_utc(timezone_name: str | None) -> tzinfo:
+    tz_name = (timezone_name or "UTC").strip() or "UTC"
+    return get_zone(tz_name) or UTC
+
+
+def format_datetime_local_value(value: datetime, timezone_name: str | None) -> str:
+    dt_utc = value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+    local = dt_utc.astimezone(zone_or_utc(timezone_name))
+    return f"{local.year:04d}-{local.month:02d}-{local.day:02d}T{local.hour:02d}:{local.minute:02d}"
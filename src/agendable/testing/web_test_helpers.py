@@ -1,10 +1,51 @@
 from __future__ import annotations
 
+import itertools
+import json
+import os
+import uuid
+from base64 import b64decode, b64encode
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
 from httpx import AsyncClient
-from sqlalchemy import select
+from itsdangerous import TimestampSigner
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agendable.db.models import MeetingSeries, User
+from agendable.auth import hash_password
+from agendable.db.models import MeetingOccurrence, MeetingSeries, User
+from agendable.db.repos import (
+    MeetingOccurrenceAttendeeRepository,
+    MeetingOccurrenceRepository,
+    MeetingSeriesRepository,
+    UserRepository,
+)
+from agendable.recurrence import build_rrule
+from agendable.services.series_service import SeriesService
+from agendable.settings import get_settings
+
+# Signature of the ``login_as`` fixture in tests/web/conftest.py.
+type LoginAs = Callable[..., Awaitable[uuid.UUID]]
+
+_UID_COUNTER = itertools.count()
+
+
+def uid() -> str:
+    """Process-unique suffix for test titles; the pid keeps xdist workers apart."""
+    return f"{os.getpid()}-{next(_UID_COUNTER)}"
+
+
+# POST /series form for a single daily occurrence; tests add a title and any overrides.
+DEFAULT_SERIES_FORM: dict[str, str | int] = {
+    "reminder_minutes_before": 60,
+    "recurrence_start_date": "2030-01-01",
+    "recurrence_time": "09:00",
+    "recurrence_timezone": "UTC",
+    "recurrence_freq": "DAILY",
+    "recurrence_interval": 1,
+    "generate_count": 1,
+}
 
 
 async def login_user(
@@ -15,7 +56,7 @@ async def login_user(
     first_name: str = "Test",
     last_name: str = "User",
     timezone: str = "UTC",
-) -> None:
+) -> uuid.UUID:
     resp = await client.post(
         "/signup",
         data={
@@ -25,49 +66,161 @@ async def login_user(
             "email": email,
             "password": password,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    if resp.status_code == 200:
-        return
+    # A 303 to the dashboard means signed in; the dashboard itself is not needed.
+    if resp.status_code == 303:
+        return session_user_id(client)
 
     resp = await client.post(
         "/login",
         data={"email": email, "password": password},
-        follow_redirects=True,
+        follow_redirects=False,
+    )
+    assert resp.status_code == 303
+    return session_user_id(client)
+
+
+def session_cookie_value(session: dict[str, str]) -> str:
+    # Same encoding as starlette's SessionMiddleware: signed base64 JSON.
+    signer = TimestampSigner(get_settings().session_secret.get_secret_value())
+    return signer.sign(b64encode(json.dumps(session).encode("utf-8"))).decode("utf-8")
+
+
+def session_user_id(client: AsyncClient) -> uuid.UUID:
+    # Read the signed-in user back out of the session cookie rather than
+    # selecting the User row by email.
+    cookie = client.cookies[get_settings().session_cookie_name]
+    signer = TimestampSigner(get_settings().session_secret.get_secret_value())
+    session = json.loads(b64decode(signer.unsign(cookie)))
+    return uuid.UUID(session["user_id"])
+
+
+def authenticate_as(client: AsyncClient, user_id: uuid.UUID) -> None:
+    cookie_name = get_settings().session_cookie_name
+    # Drop any session cookie the app already set; it is scoped to the
+    # response's domain and would otherwise shadow the one set here.
+    client.cookies.delete(cookie_name)
+    client.cookies.set(cookie_name, session_cookie_value({"user_id": str(user_id)}))
+
+
+async def seed_users(
+    db_session: AsyncSession,
+    *emails: str,
+    password: str | None = None,
+    first_name: str = "Test",
+    last_name: str = "User",
+    timezone: str = "UTC",
+) -> dict[str, uuid.UUID]:
+    # One executemany INSERT instead of a /signup round-trip (or ORM flush) per user.
+    password_hash = hash_password(password) if password is not None else None
+    user_ids = {email: uuid.uuid4() for email in emails}
+    await db_session.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "email": email,
+                "first_name": first_name,
+                "last_name": last_name,
+                "display_name": f"{first_name} {last_name}".strip(),
+                "timezone": timezone,
+                "password_hash": password_hash,
+            }
+            for email, user_id in user_ids.items()
+        ],
     )
-    assert resp.status_code == 200
+    await db_session.commit()
+    return user_ids
 
 
 async def create_series(
     client: AsyncClient,
     db_session: AsyncSession,
     *,
-    owner_email: str,
+    owner_user_id: uuid.UUID,
     title: str,
     reminder_minutes_before: int = 60,
-) -> MeetingSeries:
+) -> tuple[MeetingSeries, MeetingOccurrence]:
+    """Create a one-occurrence series through POST /series and load it with its occurrence."""
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
             "reminder_minutes_before": reminder_minutes_before,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
+    assert resp.headers["location"] == "/"
 
-    owner = (await db_session.execute(select(User).where(User.email == owner_email))).scalar_one()
-    return (
+    # Series and its generated occurrence in a single round trip.
+    row = (
         await db_session.execute(
+            select(MeetingSeries, MeetingOccurrence)
+            .join(MeetingOccurrence, MeetingOccurrence.series_id == MeetingSeries.id)
+            .where(MeetingSeries.owner_user_id == owner_user_id, MeetingSeries.title == title)
+        )
+    ).one()
+    return row.MeetingSeries, row.MeetingOccurrence
+
+
+async def insert_series(
+    db_session: AsyncSession,
+    *,
+    owner_user_id: uuid.UUID,
+    title: str,
+    scheduled_at: datetime = datetime(2030, 1, 1, 9, 0, tzinfo=UTC),
+) -> tuple[MeetingSeries, MeetingOccurrence]:
+    """Create a one-occurrence daily series the way POST /series does, minus reminders.
+
+    Goes through ``SeriesService`` rather than the form, for tests that need a series to work
+    against. The objects are returned as written, so callers need no follow-up query.
+    """
+    service = SeriesService(
+        session=db_session,
+        users=UserRepository(db_session),
+        attendees=MeetingOccurrenceAttendeeRepository(db_session),
+        series=MeetingSeriesRepository(db_session),
+        occurrences=MeetingOccurrenceRepository(db_session),
+    )
+    settings = get_settings().model_copy(update={"enable_default_email_reminders": False})
+    series, occurrences, _ = await service.create_series_for_owner(
+        owner_user_id=owner_user_id,
+        title=title,
+        reminder_minutes_before=int(DEFAULT_SERIES_FORM["reminder_minutes_before"]),
+        recurrence_rrule=build_rrule(freq="DAILY", interval=1, dtstart=scheduled_at),
+        recurrence_dtstart=scheduled_at,
+        recurrence_timezone="UTC",
+        generate_count=1,
+        attendee_emails=(),
+        settings=settings,
+    )
+    return series, occurrences[0]
+
+
+async def get_series(
+    db_session: AsyncSession, *, owner_user_id: uuid.UUID, title: str
+) -> MeetingSeries:
+    return (
+        await db_session.scalars(
             select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == owner.id,
-                MeetingSeries.title == title,
+                MeetingSeries.owner_user_id == owner_user_id, MeetingSeries.title == title
             )
         )
-    ).scalar_one()
+    ).one()
+
+
+# Built once; get_occurrence only binds the series id.
+_LATEST_OCCURRENCE = (
+    select(MeetingOccurrence)
+    .where(MeetingOccurrence.series_id == bindparam("series_id"))
+    .order_by(MeetingOccurrence.scheduled_at.desc())
+    .limit(1)
+)
+
+
+async def get_occurrence(db_session: AsyncSession, series_id: uuid.UUID) -> MeetingOccurrence:
+    """Most recent occurrence of a series."""
+    return (await db_session.scalars(_LATEST_OCCURRENCE, {"series_id": series_id})).one()
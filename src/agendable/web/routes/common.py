@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from datetime import UTC, date, datetime, time, timedelta, tzinfo
+from datetime import UTC, date, datetime, time, timedelta
 from pathlib import Path
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
 from fastapi.templating import Jinja2Templates
 
+from agendable.datetime_utils import get_zone, zone_or_utc
 from agendable.recurrence import describe_recurrence
 from agendable.sso.oidc.provider import build_oauth
 
@@ -59,34 +60,28 @@ def _build_timezone_options() -> tuple[tuple[str, str], ...]:
     return tuple(options)
 
 
-def parse_dt(value: str) -> datetime:
-    # Expect HTML datetime-local (no timezone). Treat as UTC for now.
+def _parse_iso_datetime(value: str) -> datetime:
+    # datetime.fromisoformat is C-accelerated and accepts full ISO 8601 on 3.11+.
     try:
-        dt = datetime.fromisoformat(value)
+        return datetime.fromisoformat(value)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="Invalid datetime") from exc
 
+
+def parse_dt(value: str) -> datetime:
+    # Expect HTML datetime-local (no timezone). Treat as UTC for now.
+    dt = _parse_iso_datetime(value)
     if dt.tzinfo is None:
         return dt.replace(tzinfo=UTC)
     return dt
 
 
 def parse_dt_for_timezone(value: str, timezone_name: str | None) -> datetime:
-    try:
-        dt = datetime.fromisoformat(value)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail="Invalid datetime") from exc
-
+    dt = _parse_iso_datetime(value)
     if dt.tzinfo is not None:
         return dt.astimezone(UTC)
 
-    tz_name = (timezone_name or "UTC").strip() or "UTC"
-    try:
-        local_zone: tzinfo = ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        local_zone = UTC
-
-    return dt.replace(tzinfo=local_zone).astimezone(UTC)
+    return dt.replace(tzinfo=zone_or_utc(timezone_name)).astimezone(UTC)
 
 
 def parse_date(value: str) -> date:
@@ -107,10 +102,10 @@ def parse_timezone(value: str) -> ZoneInfo:
     name = value.strip()
     if not name:
         raise HTTPException(status_code=400, detail="Invalid timezone")
-    try:
-        return ZoneInfo(name)
-    except ZoneInfoNotFoundError as exc:
-        raise HTTPException(status_code=400, detail="Unknown timezone") from exc
+    zone = get_zone(name)
+    if zone is None:
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    return zone
 
 
 def format_datetime_for_timezone(value: object, timezone_name: str | None = None) -> str:
@@ -118,15 +113,16 @@ def format_datetime_for_timezone(value: object, timezone_name: str | None = None
         return ""
 
     dt_utc = value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
-
-    tz_name = (timezone_name or "UTC").strip() or "UTC"
-    target_zone: tzinfo
-    try:
-        target_zone = ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        target_zone = UTC
-
-    return dt_utc.astimezone(target_zone).strftime("%Y-%m-%d %I:%M %p %Z")
+    local = dt_utc.astimezone(zone_or_utc(timezone_name))
+
+    # Hand-assembled equivalent of strftime("%Y-%m-%d %I:%M %p %Z"); this runs per timestamp
+    # on dashboard renders and skips strftime's format interpreter and locale lookups.
+    hour_12 = local.hour % 12 or 12
+    meridiem = "AM" if local.hour < 12 else "PM"
+    return (
+        f"{local.year:04d}-{local.month:02d}-{local.day:02d} "
+        f"{hour_12:02d}:{local.minute:02d} {meridiem} {local.tzname() or ''}"
+    )
 
 
 def recurrence_label(
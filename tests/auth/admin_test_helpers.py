@@ -43,8 +43,4 @@ async def create_user(
 
 
 async def get_user_by_id(db_session: AsyncSession, user_id: uuid.UUID) -> User:
-    return (
-        await db_session.execute(
-            select(User).where(User.id == user_id).execution_options(populate_existing=True)
-        )
-    ).scalar_one()
+    return await db_session.get_one(User, user_id, populate_existing=True)
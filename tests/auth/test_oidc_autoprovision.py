@@ -120,7 +120,8 @@ async def test_oidc_callback_rejects_link_to_existing_password_account(
         follow_redirects=True,
     )
     assert signup.status_code == 200
-    await client.post("/logout", follow_redirects=True)
+    logout = await client.post("/logout", follow_redirects=False)
+    assert logout.status_code == 303
 
     monkeypatch.setattr(
         auth_seams,
@@ -7,6 +7,7 @@ from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
+@pytest.mark.real_password_hashing
 async def test_existing_user_wrong_password_stays_401(client: AsyncClient) -> None:
     # Create the user.
     resp = await client.post(
@@ -55,7 +56,8 @@ async def test_login_rate_limit_blocks_after_configured_ip_attempts(
         follow_redirects=True,
     )
     assert signup.status_code == 200
-    await client.post("/logout", follow_redirects=True)
+    logout = await client.post("/logout", follow_redirects=False)
+    assert logout.status_code == 303
 
     first = await client.post(
         "/login",
@@ -96,7 +98,8 @@ async def test_login_rate_limit_blocks_by_account_across_ips(
         follow_redirects=True,
     )
     assert signup.status_code == 200
-    await client.post("/logout", follow_redirects=True)
+    logout = await client.post("/logout", follow_redirects=False)
+    assert logout.status_code == 303
 
     first = await client.post(
         "/login",
@@ -133,7 +136,8 @@ async def test_password_login_emits_audit_events(
         follow_redirects=True,
     )
     assert signup.status_code == 200
-    await client.post("/logout", follow_redirects=True)
+    logout = await client.post("/logout", follow_redirects=False)
+    assert logout.status_code == 303
 
     failed = await client.post(
         "/login",
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import hashlib
+import hmac
+import shutil
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
 from httpx import ASGITransport, AsyncClient
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,10 +20,34 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+import agendable.auth as auth
 import agendable.db as db
 from agendable.app import create_app
 from agendable.db.models import Base
 from agendable.rate_limit import reset_rate_limit_state
+from agendable.web.routes.common import templates
+
+
+class _Sha256PasswordHasher:
+    """Drop-in for argon2's PasswordHasher that skips the KDF in tests."""
+
+    prefix = "$test$"
+
+    def hash(self, password: str) -> str:
+        return self.prefix + hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+    def verify(self, hash: str, password: str) -> bool:
+        if not hmac.compare_digest(hash, self.hash(password)):
+            raise VerifyMismatchError
+        return True
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Anything that pulls in test_engine (client, db_session) gets its own database
+    # copy; tag it so quick runs can skip those tests with ``-m "not db"``.
+    for item in items:
+        if "test_engine" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.db)
 
 
 @pytest.fixture(autouse=True)
@@ -23,13 +55,58 @@ def reset_in_memory_rate_limits() -> None:
     reset_rate_limit_state()
 
 
+@pytest.fixture(autouse=True)
+def fast_password_hashing(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.node.get_closest_marker("real_password_hashing") is not None:
+        # Still real argon2 hashes, just at the lowest cost the library accepts.
+        hasher: PasswordHasher | _Sha256PasswordHasher = PasswordHasher(
+            time_cost=1, memory_cost=8, parallelism=1
+        )
+    else:
+        hasher = _Sha256PasswordHasher()
+    monkeypatch.setattr(auth, "_password_hasher", hasher)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def jinja_bytecode_cache(request: pytest.FixtureRequest) -> Iterator[None]:
+    # Keep compiled templates in .pytest_cache so later runs (and other xdist
+    # workers) skip lexing and parsing. Jinja keys entries by source checksum.
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        yield
+        return
+    templates.env.bytecode_cache = FileSystemBytecodeCache(str(cache.mkdir("jinja-bytecode")))
+    yield
+    templates.env.bytecode_cache = None
+
+
+@pytest.fixture(scope="session")
+def schema_template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Run the DDL once per session; each test gets a byte copy of the empty schema.
+    db_path = tmp_path_factory.mktemp("schema") / "template.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return db_path
+
+
+def _configure_sqlite(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    # Test databases are thrown away after each test, so commits need not
+    # wait for the disk.
+    cursor.execute("PRAGMA synchronous=OFF")
+    # WAL lets the verify sessions read while a request's transaction writes.
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 @pytest.fixture
-async def test_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+async def test_engine(tmp_path: Path, schema_template_db: Path) -> AsyncIterator[AsyncEngine]:
     db_path = tmp_path / "test.db"
+    shutil.copyfile(schema_template_db, db_path)
     engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", future=True)
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    event.listen(engine.sync_engine, "connect", _configure_sqlite)
 
     db.SessionMaker = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -38,16 +115,35 @@ async def test_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
     await engine.dispose()
 
 
-@pytest.fixture
-async def client(test_engine: AsyncEngine) -> AsyncIterator[AsyncClient]:
-    _ = test_engine
-    app = create_app()
-    transport = ASGITransport(app=app)
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    # Routes and middleware are built once; db.SessionMaker is looked up per
+    # request, so the shared app still talks to each test's own database.
+    return ASGITransport(app=create_app())
+
 
-    async with AsyncClient(transport=transport, base_url="http://testserver") as c:
+@pytest.fixture(scope="session")
+async def session_client(asgi_transport: ASGITransport) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(transport=asgi_transport, base_url="http://testserver") as c:
+        # Starlette assembles the middleware stack on the first request; pay for it
+        # (and the login template compile) here rather than in whichever test runs first.
+        await c.get("/login")
+        c.cookies.clear()
         yield c
 
 
+@pytest.fixture
+async def client(
+    test_engine: AsyncEngine, session_client: AsyncClient
+) -> AsyncIterator[AsyncClient]:
+    _ = test_engine
+    # One client for the whole run; clearing the jar keeps logins from leaking
+    # between tests.
+    session_client.cookies.clear()
+    yield session_client
+    session_client.cookies.clear()
+
+
 @pytest.fixture
 async def db_session(test_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
     _ = test_engine
@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 import pytest
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import agendable.cli.reminders as reminder_cli
@@ -106,11 +105,7 @@ async def test_run_due_reminders_sends_due_email_and_marks_sent(db_session: Asyn
         sent_at=None,
     )
     db_session.add_all([due_reminder, future_reminder])
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(MeetingSeries.id == occurrence.series_id)
-        )
-    ).scalar_one()
+    series = await db_session.get_one(MeetingSeries, occurrence.series_id)
     db_session.add_all(
         [
             Task(
@@ -141,12 +136,8 @@ async def test_run_due_reminders_sends_due_email_and_marks_sent(db_session: Asyn
     assert sent_payload.incomplete_tasks == ["Prepare agenda"]
 
     async with db.SessionMaker() as verify_session:
-        refreshed_due = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == due_reminder.id))
-        ).scalar_one()
-        refreshed_future = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == future_reminder.id))
-        ).scalar_one()
+        refreshed_due = await verify_session.get_one(Reminder, due_reminder.id)
+        refreshed_future = await verify_session.get_one(Reminder, future_reminder.id)
 
         assert refreshed_due.sent_at is not None
         assert refreshed_due.delivery_status == ReminderDeliveryStatus.sent
@@ -177,9 +168,7 @@ async def test_run_due_reminders_skips_non_email_channels(db_session: AsyncSessi
     assert sender.sent == []
 
     async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == slack_reminder.id))
-        ).scalar_one()
+        refreshed = await verify_session.get_one(Reminder, slack_reminder.id)
         assert refreshed.sent_at is None
         assert refreshed.delivery_status == ReminderDeliveryStatus.skipped
         assert refreshed.failure_reason_code == "unsupported_channel"
@@ -212,9 +201,7 @@ async def test_run_due_reminders_transient_failure_schedules_retry(
     await run_due_reminders(sender=TransientFailingSender(reason_code="smtp_unavailable"))
 
     async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == retry_reminder.id))
-        ).scalar_one()
+        refreshed = await verify_session.get_one(Reminder, retry_reminder.id)
 
         assert refreshed.sent_at is None
         assert refreshed.delivery_status == ReminderDeliveryStatus.retry_scheduled
@@ -252,9 +239,7 @@ async def test_run_due_reminders_terminal_failure_marks_failed(
     await run_due_reminders(sender=TerminalFailingSender(reason_code="smtp_auth_failed"))
 
     async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == failed_reminder.id))
-        ).scalar_one()
+        refreshed = await verify_session.get_one(Reminder, failed_reminder.id)
 
         assert refreshed.delivery_status == ReminderDeliveryStatus.failed_terminal
         assert refreshed.failure_reason_code == "smtp_auth_failed"
@@ -297,9 +282,7 @@ async def test_run_due_reminders_stops_retrying_at_max_attempts(
     await run_due_reminders(sender=TransientFailingSender(reason_code="smtp_unavailable"))
 
     async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == maxed_reminder.id))
-        ).scalar_one()
+        refreshed = await verify_session.get_one(Reminder, maxed_reminder.id)
 
         assert refreshed.delivery_status == ReminderDeliveryStatus.failed_terminal
         assert refreshed.attempt_count == 2
@@ -340,9 +323,7 @@ async def test_run_due_reminders_skips_send_when_claim_not_acquired(
     assert sender.sent == []
 
     async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == reminder.id))
-        ).scalar_one()
+        refreshed = await verify_session.get_one(Reminder, reminder.id)
         assert refreshed.sent_at is None
         assert refreshed.attempt_count == 0
 
@@ -381,9 +362,7 @@ async def test_try_claim_attempt_applies_lease_and_blocks_immediate_reclaim(
     assert first_claim is True
 
     async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Reminder).where(Reminder.id == reminder.id))
-        ).scalar_one()
+        refreshed = await verify_session.get_one(Reminder, reminder.id)
         assert refreshed.attempt_count == 1
         assert refreshed.next_attempt_at is not None
         assert as_utc(refreshed.next_attempt_at) > claim_now
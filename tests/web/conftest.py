@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.db.models import MeetingOccurrence
+from agendable.testing.web_test_helpers import (
+    LoginAs,
+    authenticate_as,
+    insert_series,
+    seed_users,
+    uid,
+)
+
+
+@pytest.fixture
+def login_as(client: AsyncClient, db_session: AsyncSession) -> LoginAs:
+    """Seed a user and sign the client in with a minted session cookie.
+
+    Skips the /signup and /login round-trips; tests that exercise those routes
+    should keep using ``login_user``.
+    """
+
+    async def _login_as(email: str, **user_fields: str) -> uuid.UUID:
+        user_id = (await seed_users(db_session, email, **user_fields))[email]
+        authenticate_as(client, user_id)
+        return user_id
+
+    return _login_as
+
+
+@pytest.fixture
+async def alice_id(login_as: LoginAs) -> uuid.UUID:
+    """Sign the client in as alice@example.com, the default series owner."""
+    return await login_as("alice@example.com")
+
+
+@pytest.fixture
+async def alice_occurrence(db_session: AsyncSession, alice_id: uuid.UUID) -> MeetingOccurrence:
+    """The only occurrence of a fresh series owned by the signed-in alice@example.com."""
+    _, occurrence = await insert_series(db_session, owner_user_id=alice_id, title=f"Series {uid()}")
+    return occurrence
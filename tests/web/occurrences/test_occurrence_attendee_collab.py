@@ -1,60 +1,43 @@
 from __future__ import annotations
 
-import uuid
-
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-import agendable.db as db
-from agendable.db.models import AgendaItem, MeetingOccurrence, Task, User
-from agendable.testing.web_test_helpers import create_series, login_user
+from agendable.db.models import AgendaItem, Task
+from agendable.testing.web_test_helpers import (
+    LoginAs,
+    authenticate_as,
+    create_series,
+    uid,
+)
 
 
 @pytest.mark.asyncio
 async def test_invited_attendee_can_view_occurrence_pages(
     client: AsyncClient,
     db_session: AsyncSession,
+    login_as: LoginAs,
 ) -> None:
-    await login_user(client, "view-bob@example.com", "pw-bob")
-    await client.post("/logout", follow_redirects=True)
-
-    await login_user(client, "alice@example.com", "pw-alice")
+    bob_id = await login_as("view-bob@example.com")
+    alice_id = await login_as("alice@example.com")
 
-    series = await create_series(
+    _, occ = await create_series(
         client,
         db_session,
-        owner_email="alice@example.com",
-        title=f"Invite view {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
+        owner_user_id=alice_id,
+        title=f"Invite view {uid()}",
     )
-    assert occ is not None
-
-    bob = (
-        await db_session.execute(select(User).where(User.email == "view-bob@example.com"))
-    ).scalar_one()
 
     add_attendee = await client.post(
         f"/occurrences/{occ.id}/attendees",
-        data={"email": bob.email},
+        data={"email": "view-bob@example.com"},
         follow_redirects=False,
     )
     assert add_attendee.status_code == 303
 
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, bob.email, "pw-bob")
+    authenticate_as(client, bob_id)
 
     detail_resp = await client.get(f"/occurrences/{occ.id}")
     assert detail_resp.status_code == 200
@@ -74,45 +57,26 @@ async def test_invited_attendee_can_view_occurrence_pages(
 async def test_invited_attendee_can_create_task_and_agenda_item(
     client: AsyncClient,
     db_session: AsyncSession,
+    login_as: LoginAs,
 ) -> None:
-    await login_user(client, "shared-bob@example.com", "pw-bob")
-    await client.post("/logout", follow_redirects=True)
+    bob_id = await login_as("shared-bob@example.com")
+    alice_id = await login_as("alice@example.com")
 
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
+    _, occ = await create_series(
         client,
         db_session,
-        owner_email="alice@example.com",
-        title=f"Invite mutate {uuid.uuid4()}",
+        owner_user_id=alice_id,
+        title=f"Invite mutate {uid()}",
     )
 
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
-
-    bob = (
-        await db_session.execute(select(User).where(User.email == "shared-bob@example.com"))
-    ).scalar_one()
-
     add_attendee = await client.post(
         f"/occurrences/{occ.id}/attendees",
-        data={"email": bob.email},
+        data={"email": "shared-bob@example.com"},
         follow_redirects=False,
     )
     assert add_attendee.status_code == 303
 
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, bob.email, "pw-bob")
+    authenticate_as(client, bob_id)
 
     add_task_resp = await client.post(
         f"/occurrences/{occ.id}/tasks",
@@ -148,39 +112,21 @@ async def test_invited_attendee_can_create_task_and_agenda_item(
 async def test_invited_attendee_can_toggle_and_convert_items(
     client: AsyncClient,
     db_session: AsyncSession,
+    login_as: LoginAs,
 ) -> None:
-    await login_user(client, "collab-bob@example.com", "pw-bob")
-    await client.post("/logout", follow_redirects=True)
+    bob_id = await login_as("collab-bob@example.com")
+    alice_id = await login_as("alice@example.com")
 
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
+    series, occ = await create_series(
         client,
         db_session,
-        owner_email="alice@example.com",
-        title=f"Invite collab mutate {uuid.uuid4()}",
+        owner_user_id=alice_id,
+        title=f"Invite collab mutate {uid()}",
     )
 
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
-
-    bob = (
-        await db_session.execute(select(User).where(User.email == "collab-bob@example.com"))
-    ).scalar_one()
-
     add_attendee = await client.post(
         f"/occurrences/{occ.id}/attendees",
-        data={"email": bob.email},
+        data={"email": "collab-bob@example.com"},
         follow_redirects=False,
     )
     assert add_attendee.status_code == 303
@@ -196,12 +142,8 @@ async def test_invited_attendee_can_toggle_and_convert_items(
     convert_agenda = AgendaItem(occurrence_id=occ.id, body="Convert me", is_done=False)
     db_session.add_all([owner_task, owner_agenda, convert_agenda])
     await db_session.commit()
-    await db_session.refresh(owner_task)
-    await db_session.refresh(owner_agenda)
-    await db_session.refresh(convert_agenda)
 
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, bob.email, "pw-bob")
+    authenticate_as(client, bob_id)
 
     toggle_task_resp = await client.post(
         f"/tasks/{owner_task.id}/toggle",
@@ -217,30 +159,25 @@ async def test_invited_attendee_can_toggle_and_convert_items(
 
     convert_resp = await client.post(
         f"/agenda/{convert_agenda.id}/convert-to-task",
-        data={"assigned_user_id": str(bob.id)},
+        data={"assigned_user_id": str(bob_id)},
         follow_redirects=False,
     )
     assert convert_resp.status_code == 303
 
-    async with db.SessionMaker() as verify_session:
-        toggled_task = (
-            await verify_session.execute(select(Task).where(Task.id == owner_task.id))
-        ).scalar_one()
-        toggled_agenda = (
-            await verify_session.execute(select(AgendaItem).where(AgendaItem.id == owner_agenda.id))
-        ).scalar_one()
-        converted_agenda = (
-            await verify_session.execute(
-                select(AgendaItem).where(AgendaItem.id == convert_agenda.id)
-            )
-        ).scalar_one()
-        converted_task = (
-            await verify_session.execute(
-                select(Task).where(Task.occurrence_id == occ.id, Task.title == "Convert me")
-            )
-        ).scalar_one()
+    task_done = await db_session.scalar(select(Task.is_done).where(Task.id == owner_task.id))
+    toggled_agenda_done = await db_session.scalar(
+        select(AgendaItem.is_done).where(AgendaItem.id == owner_agenda.id)
+    )
+    converted_agenda_done = await db_session.scalar(
+        select(AgendaItem.is_done).where(AgendaItem.id == convert_agenda.id)
+    )
+    converted_task = (
+        await db_session.execute(
+            select(Task).where(Task.occurrence_id == occ.id, Task.title == "Convert me")
+        )
+    ).scalar_one()
 
-        assert toggled_task.is_done is True
-        assert toggled_agenda.is_done is True
-        assert converted_agenda.is_done is True
-        assert converted_task.assigned_user_id == bob.id
+    assert task_done is True
+    assert toggled_agenda_done is True
+    assert converted_agenda_done is True
+    assert converted_task.assigned_user_id == bob_id
@@ -4,43 +4,23 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-import agendable.db as db
 from agendable.db.models import AgendaItem, MeetingOccurrence, Task, User
-from agendable.testing.web_test_helpers import create_series, login_user
+from agendable.testing.web_test_helpers import LoginAs, uid
 
 
 @pytest.mark.asyncio
 async def test_convert_agenda_item_to_task_assigns_attendee_and_marks_done(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_occurrence: MeetingOccurrence,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Convert Agenda {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    occ = alice_occurrence
 
     bob = User(
-        email=f"convert-bob-{uuid.uuid4()}@example.com",
+        email=f"convert-bob-{uid()}@example.com",
         first_name="Bob",
         last_name="Convert",
         display_name="Bob Convert",
@@ -49,7 +29,6 @@ async def test_convert_agenda_item_to_task_assigns_attendee_and_marks_done(
     )
     db_session.add(bob)
     await db_session.commit()
-    await db_session.refresh(bob)
 
     add_attendee_resp = await client.post(
         f"/occurrences/{occ.id}/attendees",
@@ -66,7 +45,6 @@ async def test_convert_agenda_item_to_task_assigns_attendee_and_marks_done(
     )
     db_session.add(agenda)
     await db_session.commit()
-    await db_session.refresh(agenda)
 
     convert_resp = await client.post(
         f"/agenda/{agenda.id}/convert-to-task",
@@ -86,41 +64,22 @@ async def test_convert_agenda_item_to_task_assigns_attendee_and_marks_done(
     assert converted_task.assigned_user_id == bob.id
     assert converted_task.description == "Break it into milestones"
 
-    async with db.SessionMaker() as verify_session:
-        refreshed_agenda = (
-            await verify_session.execute(select(AgendaItem).where(AgendaItem.id == agenda.id))
-        ).scalar_one()
-        assert refreshed_agenda.is_done is True
+    # A column read bypasses the AgendaItem object cached in db_session.
+    agenda_done = await db_session.scalar(
+        select(AgendaItem.is_done).where(AgendaItem.id == agenda.id)
+    )
+    assert agenda_done is True
 
 
 async def test_convert_agenda_item_to_task_rejects_non_attendee_assignee(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_occurrence: MeetingOccurrence,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Convert Guardrail {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    occ = alice_occurrence
 
     outsider = User(
-        email=f"outsider-{uuid.uuid4()}@example.com",
+        email=f"outsider-{uid()}@example.com",
         first_name="Out",
         last_name="Sider",
         display_name="Out Sider",
@@ -132,8 +91,6 @@ async def test_convert_agenda_item_to_task_rejects_non_attendee_assignee(
     agenda = AgendaItem(occurrence_id=occ.id, body="Should not convert", is_done=False)
     db_session.add(agenda)
     await db_session.commit()
-    await db_session.refresh(outsider)
-    await db_session.refresh(agenda)
 
     convert_resp = await client.post(
         f"/agenda/{agenda.id}/convert-to-task",
@@ -143,50 +100,26 @@ async def test_convert_agenda_item_to_task_rejects_non_attendee_assignee(
     assert convert_resp.status_code == 400
     assert convert_resp.json()["detail"] == "Assignee must be a meeting attendee."
 
-    created_tasks = (
-        (
-            await db_session.execute(
-                select(Task).where(
-                    Task.occurrence_id == occ.id,
-                    Task.title == "Should not convert",
-                )
-            )
+    created_task_count = await db_session.scalar(
+        select(func.count(Task.id)).where(
+            Task.occurrence_id == occ.id,
+            Task.title == "Should not convert",
         )
-        .scalars()
-        .all()
     )
-    assert created_tasks == []
+    assert created_task_count == 0
 
 
 async def test_occurrence_shared_panel_renders_live_sections(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_id: uuid.UUID,
+    alice_occurrence: MeetingOccurrence,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Shared panel {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    occ = alice_occurrence
 
     task = Task(
         occurrence_id=occ.id,
-        assigned_user_id=series.owner_user_id,
+        assigned_user_id=alice_id,
         title="Shared task",
         description="Shared task details",
         due_at=occ.scheduled_at,
@@ -218,31 +151,12 @@ async def test_occurrence_shared_panel_renders_live_sections(
 async def test_occurrence_shared_panel_is_scoped_to_owner(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_occurrence: MeetingOccurrence,
+    login_as: LoginAs,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Shared panel scope {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    occ = alice_occurrence
 
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "bob@example.com", "pw-bob")
+    await login_as("bob@example.com")
 
     resp = await client.get(f"/occurrences/{occ.id}/shared-panel")
     assert resp.status_code == 404
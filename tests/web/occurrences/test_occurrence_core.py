@@ -1,51 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
-from datetime import timedelta
+from datetime import UTC, timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-import agendable.db as db
 from agendable.db.models import AgendaItem, MeetingOccurrence, Task, User
-from agendable.testing.web_test_helpers import create_series, login_user
+from agendable.testing.web_test_helpers import LoginAs, uid
 
 
 @pytest.mark.asyncio
 async def test_task_create_and_toggle_is_scoped(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
+    alice_occurrence: MeetingOccurrence,
+    login_as: LoginAs,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Tasks {uuid.uuid4()}",
-    )
-
-    # Use the auto-generated occurrence.
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    # Use the seeded occurrence.
+    occ = alice_occurrence
 
     resp = await client.post(
         f"/occurrences/{occ.id}/tasks",
         data={"title": "Do the thing", "description": "Task details"},
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
 
     task = (
         await db_session.execute(
@@ -54,59 +38,39 @@ async def test_task_create_and_toggle_is_scoped(
     ).scalar_one()
     assert task.is_done is False
     assert task.description == "Task details"
-    assert task.assigned_user_id == series.owner_user_id
-    assert task.due_at == occ.scheduled_at
+    assert task.assigned_user_id == alice_id
+    assert task.due_at.replace(tzinfo=UTC) == occ.scheduled_at
     task_id = task.id
 
-    resp = await client.post(f"/tasks/{task.id}/toggle", follow_redirects=True)
-    assert resp.status_code == 200
+    resp = await client.post(f"/tasks/{task.id}/toggle", follow_redirects=False)
+    assert resp.status_code == 303
 
-    async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(Task).where(Task.id == task_id))
-        ).scalar_one()
-        assert refreshed.is_done is True
+    # Column reads skip the identity map, so they see what the request committed.
+    task_done = await db_session.scalar(select(Task.is_done).where(Task.id == task_id))
+    assert task_done is True
 
     # Other users cannot toggle Alice's tasks.
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "bob@example.com", "pw-bob")
+    await login_as("bob@example.com")
 
     resp = await client.post(f"/tasks/{task.id}/toggle")
     assert resp.status_code == 404
 
 
 async def test_agenda_add_and_toggle_is_scoped(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_occurrence: MeetingOccurrence,
+    login_as: LoginAs,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Agenda {uuid.uuid4()}",
-    )
-
-    # Use the auto-generated occurrence.
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    # Use the seeded occurrence.
+    occ = alice_occurrence
 
     resp = await client.post(
         f"/occurrences/{occ.id}/agenda",
         data={"body": "Talk about priorities", "description": "Agenda context"},
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
 
     item = (
         await db_session.execute(
@@ -119,140 +83,102 @@ async def test_agenda_add_and_toggle_is_scoped(
     assert item.description == "Agenda context"
     item_id = item.id
 
-    resp = await client.post(f"/agenda/{item.id}/toggle", follow_redirects=True)
-    assert resp.status_code == 200
+    resp = await client.post(f"/agenda/{item.id}/toggle", follow_redirects=False)
+    assert resp.status_code == 303
 
-    async with db.SessionMaker() as verify_session:
-        refreshed = (
-            await verify_session.execute(select(AgendaItem).where(AgendaItem.id == item_id))
-        ).scalar_one()
-        assert refreshed.is_done is True
+    item_done = await db_session.scalar(select(AgendaItem.is_done).where(AgendaItem.id == item_id))
+    assert item_done is True
 
     # Other users cannot toggle Alice's agenda.
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "bob@example.com", "pw-bob")
+    await login_as("bob@example.com")
 
     resp = await client.post(f"/agenda/{item.id}/toggle")
     assert resp.status_code == 404
 
 
 async def test_complete_occurrence_rolls_unfinished_items_to_next_occurrence(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
+    alice_occurrence: MeetingOccurrence,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Roll {uuid.uuid4()}",
-    )
-
-    first = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.asc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert first is not None
+    first = alice_occurrence
 
     second = MeetingOccurrence(
-        series_id=series.id,
+        series_id=first.series_id,
         scheduled_at=first.scheduled_at + timedelta(days=1),
         notes="",
     )
+    unfinished_task_id, completed_task_id = uuid.uuid4(), uuid.uuid4()
+    unfinished_agenda_id, completed_agenda_id = uuid.uuid4(), uuid.uuid4()
     db_session.add(second)
-    await db_session.commit()
-    await db_session.refresh(second)
-
-    unfinished_task = Task(
-        occurrence_id=first.id,
-        assigned_user_id=series.owner_user_id,
-        due_at=first.scheduled_at,
-        title="Move me",
-        is_done=False,
+    await db_session.execute(
+        insert(Task),
+        [
+            {
+                "id": task_id,
+                "occurrence_id": first.id,
+                "assigned_user_id": alice_id,
+                "due_at": first.scheduled_at,
+                "title": title,
+                "is_done": is_done,
+            }
+            for task_id, title, is_done in [
+                (unfinished_task_id, "Move me", False),
+                (completed_task_id, "Keep me", True),
+            ]
+        ],
     )
-    completed_task = Task(
-        occurrence_id=first.id,
-        assigned_user_id=series.owner_user_id,
-        due_at=first.scheduled_at,
-        title="Keep me",
-        is_done=True,
+    await db_session.execute(
+        insert(AgendaItem),
+        [
+            {"id": item_id, "occurrence_id": first.id, "body": body, "is_done": is_done}
+            for item_id, body, is_done in [
+                (unfinished_agenda_id, "Move agenda", False),
+                (completed_agenda_id, "Keep agenda", True),
+            ]
+        ],
     )
-    unfinished_agenda = AgendaItem(occurrence_id=first.id, body="Move agenda", is_done=False)
-    completed_agenda = AgendaItem(occurrence_id=first.id, body="Keep agenda", is_done=True)
-    db_session.add_all([unfinished_task, completed_task, unfinished_agenda, completed_agenda])
     await db_session.commit()
 
     resp = await client.post(f"/occurrences/{first.id}/complete", follow_redirects=False)
     assert resp.status_code == 303
     assert resp.headers["location"] == f"/occurrences/{second.id}"
 
-    async with db.SessionMaker() as verify_session:
-        refreshed_first = (
-            await verify_session.execute(
-                select(MeetingOccurrence).where(MeetingOccurrence.id == first.id)
-            )
-        ).scalar_one()
-        assert refreshed_first.is_completed is True
-
-        moved_task = (
-            await verify_session.execute(select(Task).where(Task.id == unfinished_task.id))
-        ).scalar_one()
-        kept_task = (
-            await verify_session.execute(select(Task).where(Task.id == completed_task.id))
-        ).scalar_one()
-        assert moved_task.occurrence_id == second.id
-        assert kept_task.occurrence_id == first.id
-        assert moved_task.due_at == second.scheduled_at
-        assert kept_task.due_at == first.scheduled_at
-
-        moved_agenda = (
-            await verify_session.execute(
-                select(AgendaItem).where(AgendaItem.id == unfinished_agenda.id)
-            )
-        ).scalar_one()
-        kept_agenda = (
-            await verify_session.execute(
-                select(AgendaItem).where(AgendaItem.id == completed_agenda.id)
-            )
-        ).scalar_one()
-        assert moved_agenda.occurrence_id == second.id
-        assert kept_agenda.occurrence_id == first.id
+    first_completed = await db_session.scalar(
+        select(MeetingOccurrence.is_completed).where(MeetingOccurrence.id == first.id)
+    )
+    assert first_completed is True
+
+    # The seeded items went in through Core inserts, so these ORM reads load fresh rows.
+    tasks = {
+        t.id: t
+        for t in await db_session.scalars(
+            select(Task).where(Task.id.in_([unfinished_task_id, completed_task_id]))
+        )
+    }
+    assert tasks[unfinished_task_id].occurrence_id == second.id
+    assert tasks[completed_task_id].occurrence_id == first.id
+    assert tasks[unfinished_task_id].due_at.replace(tzinfo=UTC) == second.scheduled_at
+    assert tasks[completed_task_id].due_at.replace(tzinfo=UTC) == first.scheduled_at
+
+    agenda_items = {
+        a.id: a
+        for a in await db_session.scalars(
+            select(AgendaItem).where(AgendaItem.id.in_([unfinished_agenda_id, completed_agenda_id]))
+        )
+    }
+    assert agenda_items[unfinished_agenda_id].occurrence_id == second.id
+    assert agenda_items[completed_agenda_id].occurrence_id == first.id
 
 
 async def test_task_assignment_requires_attendee(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient, db_session: AsyncSession, alice_occurrence: MeetingOccurrence
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"Assign {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    occ = alice_occurrence
 
     bob = User(
-        email=f"bob-{uuid.uuid4()}@example.com",
+        email=f"bob-{uid()}@example.com",
         first_name="Bob",
         last_name="Builder",
         display_name="Bob Builder",
@@ -261,7 +187,6 @@ async def test_task_assignment_requires_attendee(
     )
     db_session.add(bob)
     await db_session.commit()
-    await db_session.refresh(bob)
 
     resp = await client.post(
         f"/occurrences/{occ.id}/tasks",
@@ -293,39 +218,23 @@ async def test_task_assignment_requires_attendee(
 
 
 async def test_completed_occurrence_is_read_only(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
+    alice_occurrence: MeetingOccurrence,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-    series = await create_series(
-        client,
-        db_session,
-        owner_email="alice@example.com",
-        title=f"ReadOnly {uuid.uuid4()}",
-    )
-
-    occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert occ is not None
+    occ = alice_occurrence
 
     task = Task(
         occurrence_id=occ.id,
-        assigned_user_id=series.owner_user_id,
+        assigned_user_id=alice_id,
         due_at=occ.scheduled_at,
         title="Existing task",
         is_done=False,
     )
     agenda = AgendaItem(occurrence_id=occ.id, body="Existing agenda", is_done=False)
     bob = User(
-        email=f"readonly-bob-{uuid.uuid4()}@example.com",
+        email=f"readonly-bob-{uid()}@example.com",
         first_name="Bob",
         last_name="Readonly",
         display_name="Bob Readonly",
@@ -334,34 +243,21 @@ async def test_completed_occurrence_is_read_only(
     )
     db_session.add_all([task, agenda, bob])
     await db_session.commit()
-    await db_session.refresh(task)
-    await db_session.refresh(agenda)
-    await db_session.refresh(bob)
 
     resp = await client.post(f"/occurrences/{occ.id}/complete", follow_redirects=False)
     assert resp.status_code == 303
 
-    add_task_resp = await client.post(
-        f"/occurrences/{occ.id}/tasks",
-        data={"title": "Should fail"},
-        follow_redirects=False,
+    # Adds are rejected before anything is written, so post them concurrently.
+    add_task_resp, add_agenda_resp, add_attendee_resp = await asyncio.gather(
+        client.post(f"/occurrences/{occ.id}/tasks", data={"title": "Should fail"}),
+        client.post(f"/occurrences/{occ.id}/agenda", data={"body": "Should fail"}),
+        client.post(f"/occurrences/{occ.id}/attendees", data={"email": bob.email}),
     )
     assert add_task_resp.status_code == 400
-
-    add_agenda_resp = await client.post(
-        f"/occurrences/{occ.id}/agenda",
-        data={"body": "Should fail"},
-        follow_redirects=False,
-    )
     assert add_agenda_resp.status_code == 400
-
-    add_attendee_resp = await client.post(
-        f"/occurrences/{occ.id}/attendees",
-        data={"email": bob.email},
-        follow_redirects=False,
-    )
     assert add_attendee_resp.status_code == 400
 
+    # Completing rolled the open task and agenda item forward, so these toggles write.
     toggle_task_resp = await client.post(f"/tasks/{task.id}/toggle", follow_redirects=False)
     assert toggle_task_resp.status_code == 303
 
@@ -377,43 +273,27 @@ async def test_completed_occurrence_is_read_only(
     assert 'id="task-add-button" type="submit" disabled' in detail_resp.text
     assert 'id="agenda-add-button" type="submit" disabled' in detail_resp.text
 
-    async with db.SessionMaker() as verify_session:
-        refreshed_occ = (
-            await verify_session.execute(
-                select(MeetingOccurrence).where(MeetingOccurrence.id == occ.id)
-            )
-        ).scalar_one()
-        assert refreshed_occ.is_completed is True
-
-        refreshed_task = (
-            await verify_session.execute(select(Task).where(Task.id == task.id))
-        ).scalar_one()
-        refreshed_agenda = (
-            await verify_session.execute(select(AgendaItem).where(AgendaItem.id == agenda.id))
-        ).scalar_one()
-        assert refreshed_task.is_done is True
-        assert refreshed_agenda.is_done is True
-
-        still_one_task = (
-            (
-                await verify_session.execute(
-                    select(Task).where(Task.occurrence_id == occ.id, Task.title == "Existing task")
-                )
-            )
-            .scalars()
-            .all()
+    occ_completed = await db_session.scalar(
+        select(MeetingOccurrence.is_completed).where(MeetingOccurrence.id == occ.id)
+    )
+    task_done = await db_session.scalar(select(Task.is_done).where(Task.id == task.id))
+    agenda_done = await db_session.scalar(
+        select(AgendaItem.is_done).where(AgendaItem.id == agenda.id)
+    )
+    assert occ_completed is True
+    assert task_done is True
+    assert agenda_done is True
+
+    still_one_task = await db_session.scalar(
+        select(func.count(Task.id)).where(
+            Task.occurrence_id == occ.id, Task.title == "Existing task"
         )
-        still_one_agenda = (
-            (
-                await verify_session.execute(
-                    select(AgendaItem).where(
-                        AgendaItem.occurrence_id == occ.id,
-                        AgendaItem.body == "Existing agenda",
-                    )
-                )
-            )
-            .scalars()
-            .all()
+    )
+    still_one_agenda = await db_session.scalar(
+        select(func.count(AgendaItem.id)).where(
+            AgendaItem.occurrence_id == occ.id,
+            AgendaItem.body == "Existing agenda",
         )
-        assert len(still_one_task) == 0
-        assert len(still_one_agenda) == 0
+    )
+    assert still_one_task == 0
+    assert still_one_agenda == 0
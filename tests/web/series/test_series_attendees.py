@@ -4,22 +4,20 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import (
     MeetingOccurrence,
     MeetingOccurrenceAttendee,
-    MeetingSeries,
-    User,
 )
-from agendable.testing.web_test_helpers import login_user
+from agendable.testing.web_test_helpers import DEFAULT_SERIES_FORM, get_series, uid
 
 
 @pytest.mark.asyncio
-async def test_add_series_attendee_404_when_series_not_owned(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
+async def test_add_series_attendee_404_when_series_not_owned(
+    client: AsyncClient, alice_id: uuid.UUID
+) -> None:
     resp = await client.post(
         f"/series/{uuid.uuid4()}/attendees",
         data={"email": "bob@example.com"},
@@ -32,37 +30,21 @@ async def test_add_series_attendee_404_when_series_not_owned(client: AsyncClient
 async def test_add_series_attendee_adds_to_all_occurrences_and_is_idempotent(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Series attendees {uuid.uuid4()}"
+    title = f"Series attendees {uid()}"
     create_resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
             "generate_count": 3,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert create_resp.status_code == 200
-
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    assert create_resp.status_code == 303
+
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
     first = await client.post(
         f"/series/{series.id}/attendees",
@@ -78,65 +60,38 @@ async def test_add_series_attendee_adds_to_all_occurrences_and_is_idempotent(
     )
     assert second.status_code == 303
 
-    occurrence_count = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence.id).where(MeetingOccurrence.series_id == series.id)
-            )
-        )
-        .scalars()
-        .all()
+    occurrence_count = await db_session.scalar(
+        select(func.count(MeetingOccurrence.id)).where(MeetingOccurrence.series_id == series.id)
     )
-    links = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrenceAttendee).where(
-                    MeetingOccurrenceAttendee.user_id == alice.id,
-                    MeetingOccurrenceAttendee.occurrence_id.in_(occurrence_count),
-                )
-            )
+    link_count = await db_session.scalar(
+        select(func.count(MeetingOccurrenceAttendee.id))
+        .join(MeetingOccurrence, MeetingOccurrenceAttendee.occurrence_id == MeetingOccurrence.id)
+        .where(
+            MeetingOccurrence.series_id == series.id,
+            MeetingOccurrenceAttendee.user_id == alice_id,
         )
-        .scalars()
-        .all()
     )
 
-    assert len(links) == len(occurrence_count) == 3
+    assert link_count == occurrence_count == 3
 
 
 async def test_add_series_attendee_shows_inline_validation_error(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Series attendee validation {uuid.uuid4()}"
+    title = f"Series attendee validation {uid()}"
     create_resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert create_resp.status_code == 200
-
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    assert create_resp.status_code == 303
+
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
     resp = await client.post(
         f"/series/{series.id}/attendees",
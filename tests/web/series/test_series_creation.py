@@ -4,103 +4,73 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import (
     MeetingOccurrence,
     MeetingOccurrenceAttendee,
-    MeetingSeries,
-    User,
 )
-from agendable.testing.web_test_helpers import login_user
+from agendable.testing.web_test_helpers import (
+    DEFAULT_SERIES_FORM,
+    LoginAs,
+    get_series,
+    seed_users,
+    uid,
+)
 
 
 @pytest.mark.asyncio
 async def test_create_series_adds_entered_attendees_to_generated_occurrences(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "teammate@example.com", "pw-teammate")
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Create attendee emails {uuid.uuid4()}"
+    teammate_id = (await seed_users(db_session, "teammate@example.com"))["teammate@example.com"]
+    title = f"Create attendee emails {uid()}"
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
             "attendee_emails": "teammate@example.com",
             "generate_count": 2,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
+    assert resp.headers["location"] == "/"
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    teammate = (
-        await db_session.execute(select(User).where(User.email == "teammate@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
-    occurrences = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence.id).where(MeetingOccurrence.series_id == series.id)
-            )
-        )
-        .scalars()
-        .all()
+    occurrence_count = await db_session.scalar(
+        select(func.count(MeetingOccurrence.id)).where(MeetingOccurrence.series_id == series.id)
     )
-    teammate_links = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrenceAttendee).where(
-                    MeetingOccurrenceAttendee.user_id == teammate.id,
-                    MeetingOccurrenceAttendee.occurrence_id.in_(occurrences),
-                )
-            )
+    teammate_link_count = await db_session.scalar(
+        select(func.count(MeetingOccurrenceAttendee.id))
+        .join(MeetingOccurrence, MeetingOccurrenceAttendee.occurrence_id == MeetingOccurrence.id)
+        .where(
+            MeetingOccurrence.series_id == series.id,
+            MeetingOccurrenceAttendee.user_id == teammate_id,
         )
-        .scalars()
-        .all()
     )
 
-    assert len(teammate_links) == len(occurrences) == 2
+    assert teammate_link_count == occurrence_count == 2
 
 
 async def test_create_series_and_list_is_scoped_to_user(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    login_as: LoginAs,
+    alice_id: uuid.UUID,
 ) -> None:
-    title = f"1:1 {uuid.uuid4()}"
-
-    await login_user(client, "alice@example.com", "pw-alice")
+    title = f"1:1 {uid()}"
 
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
         },
         follow_redirects=True,
     )
@@ -108,21 +78,10 @@ async def test_create_series_and_list_is_scoped_to_user(
     assert title in resp.text
 
     # Ensure it exists in the DB for Alice.
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
-    # Logout + login as Bob: Alice's series should not be visible.
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "bob@example.com", "pw-bob")
+    # Switch to Bob: Alice's series should not be visible.
+    await login_as("bob@example.com")
 
     resp = await client.get("/")
     assert resp.status_code == 200
@@ -136,145 +95,73 @@ async def test_create_series_and_list_is_scoped_to_user(
 async def test_create_series_auto_adds_owner_as_attendee_to_generated_occurrences(
     client: AsyncClient,
     db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Owner attendee {uuid.uuid4()}"
+    title = f"Owner attendee {uid()}"
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
             "generate_count": 2,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
+    assert resp.headers["location"] == "/"
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
-    occurrences = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence.id).where(MeetingOccurrence.series_id == series.id)
-            )
-        )
-        .scalars()
-        .all()
+    occurrence_count = await db_session.scalar(
+        select(func.count(MeetingOccurrence.id)).where(MeetingOccurrence.series_id == series.id)
     )
-    owner_links = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrenceAttendee).where(
-                    MeetingOccurrenceAttendee.user_id == alice.id,
-                    MeetingOccurrenceAttendee.occurrence_id.in_(occurrences),
-                )
-            )
+    owner_link_count = await db_session.scalar(
+        select(func.count(MeetingOccurrenceAttendee.id))
+        .join(MeetingOccurrence, MeetingOccurrenceAttendee.occurrence_id == MeetingOccurrence.id)
+        .where(
+            MeetingOccurrence.series_id == series.id,
+            MeetingOccurrenceAttendee.user_id == alice_id,
         )
-        .scalars()
-        .all()
     )
 
-    assert len(owner_links) == len(occurrences) == 2
+    assert owner_link_count == occurrence_count == 2
 
 
 async def test_create_series_generates_occurrences(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Generate {uuid.uuid4()}"
+    title = f"Generate {uid()}"
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
             "generate_count": 3,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
+    assert resp.headers["location"] == "/"
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
-
-    occs = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.asc())
-            )
-        )
-        .scalars()
-        .all()
-    )
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
-    assert len(occs) == 3
-
-
-async def test_create_series_rejects_unknown_attendee_email(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Unknown attendee",
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "attendee_emails": "unknown@example.com",
-            "generate_count": 1,
-        },
+    occurrence_count = await db_session.scalar(
+        select(func.count())
+        .select_from(MeetingOccurrence)
+        .where(MeetingOccurrence.series_id == series.id)
     )
 
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "Unknown attendee email(s): unknown@example.com"
+    assert occurrence_count == 3
 
 
 async def test_create_series_requires_auth(client: AsyncClient) -> None:
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": "X",
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
         },
     )
     assert resp.status_code == 401
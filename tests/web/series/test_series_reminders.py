@@ -5,17 +5,31 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import (
     MeetingOccurrence,
-    MeetingSeries,
     Reminder,
     ReminderChannel,
-    User,
 )
-from agendable.testing.web_test_helpers import login_user
+from agendable.testing.web_test_helpers import DEFAULT_SERIES_FORM, get_occurrence, get_series, uid
+
+# Outer join so an occurrence that is missing its reminder still shows up (as None).
+_SERIES_OCCURRENCE_REMINDERS = (
+    select(MeetingOccurrence, Reminder)
+    .outerjoin(Reminder, Reminder.occurrence_id == MeetingOccurrence.id)
+    .where(MeetingOccurrence.series_id == bindparam("series_id"))
+    .order_by(MeetingOccurrence.scheduled_at.asc())
+)
+
+
+async def _occurrence_reminders_for_series(
+    db_session: AsyncSession, series_id: uuid.UUID
+) -> list[tuple[MeetingOccurrence, Reminder | None]]:
+    # Same statement object every call, so the compiled SQL is reused from the statement cache.
+    result = await db_session.execute(_SERIES_OCCURRENCE_REMINDERS, {"series_id": series_id})
+    return list(result.tuples())
 
 
 def _as_utc(dt: datetime) -> datetime:
@@ -25,9 +39,9 @@ def _as_utc(dt: datetime) -> datetime:
 
 
 @pytest.mark.asyncio
-async def test_create_occurrence_404_when_series_not_owned(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
+async def test_create_occurrence_404_when_series_not_owned(
+    client: AsyncClient, alice_id: uuid.UUID
+) -> None:
     resp = await client.post(
         f"/series/{uuid.uuid4()}/occurrences",
         data={"scheduled_at": "2030-01-10T09:00:00Z"},
@@ -38,123 +52,52 @@ async def test_create_occurrence_404_when_series_not_owned(client: AsyncClient)
 
 
 async def test_create_series_auto_creates_email_reminders(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Reminders {uuid.uuid4()}"
+    title = f"Reminders {uid()}"
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
             "reminder_minutes_before": 120,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
             "generate_count": 2,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
-    occs = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.asc())
-            )
-        )
-        .scalars()
-        .all()
-    )
-    reminders = (
-        (
-            await db_session.execute(
-                select(Reminder)
-                .join(MeetingOccurrence, Reminder.occurrence_id == MeetingOccurrence.id)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.asc())
-            )
-        )
-        .scalars()
-        .all()
-    )
+    rows = await _occurrence_reminders_for_series(db_session, series.id)
 
-    assert len(reminders) == len(occs) == 2
-    for occ, reminder in zip(occs, reminders, strict=True):
+    assert len(rows) == 2
+    for occ, reminder in rows:
+        assert reminder is not None
         assert reminder.channel == ReminderChannel.email
         assert _as_utc(reminder.send_at) == _as_utc(occ.scheduled_at) - timedelta(minutes=120)
 
 
-async def test_create_series_rejects_invalid_reminder_minutes_before(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Invalid Reminder",
-            "reminder_minutes_before": -1,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
-        },
-    )
-
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "reminder_minutes_before must be between 0 and 43200"
-
-
 async def test_manual_occurrence_creation_auto_creates_email_reminder(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Manual reminder {uuid.uuid4()}"
+    title = f"Manual reminder {uid()}"
     create_resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
             "reminder_minutes_before": 45,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert create_resp.status_code == 200
+    assert create_resp.status_code == 303
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
     resp = await client.post(
         f"/series/{series.id}/occurrences",
@@ -163,30 +106,15 @@ async def test_manual_occurrence_creation_auto_creates_email_reminder(
     )
     assert resp.status_code == 303
 
-    manual_occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert manual_occ is not None
+    manual_occ = await get_occurrence(db_session, series.id)
 
     reminder = (
-        (
-            await db_session.execute(
-                select(Reminder)
-                .where(Reminder.occurrence_id == manual_occ.id)
-                .order_by(Reminder.send_at.desc())
-            )
+        await db_session.scalars(
+            select(Reminder)
+            .where(Reminder.occurrence_id == manual_occ.id)
+            .order_by(Reminder.send_at.desc())
         )
-        .scalars()
-        .first()
-    )
+    ).first()
     assert reminder is not None
     assert reminder.channel == ReminderChannel.email
     assert _as_utc(reminder.send_at) == _as_utc(manual_occ.scheduled_at) - timedelta(minutes=45)
@@ -196,38 +124,22 @@ async def test_manual_occurrence_creation_skips_reminder_when_default_disabled(
     client: AsyncClient,
     db_session: AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
+    alice_id: uuid.UUID,
 ) -> None:
     monkeypatch.setenv("AGENDABLE_ENABLE_DEFAULT_EMAIL_REMINDERS", "false")
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Manual no reminder {uuid.uuid4()}"
+    title = f"Manual no reminder {uid()}"
     create_resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
             "reminder_minutes_before": 45,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert create_resp.status_code == 200
+    assert create_resp.status_code == 303
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
     resp = await client.post(
         f"/series/{series.id}/occurrences",
@@ -236,28 +148,13 @@ async def test_manual_occurrence_creation_skips_reminder_when_default_disabled(
     )
     assert resp.status_code == 303
 
-    manual_occ = (
-        (
-            await db_session.execute(
-                select(MeetingOccurrence)
-                .where(MeetingOccurrence.series_id == series.id)
-                .order_by(MeetingOccurrence.scheduled_at.desc())
-            )
-        )
-        .scalars()
-        .first()
-    )
-    assert manual_occ is not None
+    manual_occ = await get_occurrence(db_session, series.id)
 
     reminder = (
-        (
-            await db_session.execute(
-                select(Reminder)
-                .where(Reminder.occurrence_id == manual_occ.id)
-                .order_by(Reminder.send_at.desc())
-            )
+        await db_session.scalars(
+            select(Reminder)
+            .where(Reminder.occurrence_id == manual_occ.id)
+            .order_by(Reminder.send_at.desc())
         )
-        .scalars()
-        .first()
-    )
+    ).first()
     assert reminder is None
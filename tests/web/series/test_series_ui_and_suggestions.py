@@ -4,20 +4,30 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
 
 from agendable.db.models import (
-    MeetingSeries,
     User,
 )
-from agendable.testing.web_test_helpers import login_user
+from agendable.testing.web_test_helpers import DEFAULT_SERIES_FORM, get_series, seed_users, uid
+from agendable.web.routes.series import series_recurrence_options
 
 
-@pytest.mark.asyncio
-async def test_series_attendee_suggestions_ignores_short_queries(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
+def _build_request(path: str) -> Request:
+    scope: dict[str, object] = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [],
+    }
+    return Request(scope)
+
 
+@pytest.mark.asyncio
+async def test_series_attendee_suggestions_ignores_short_queries(
+    client: AsyncClient, alice_id: uuid.UUID
+) -> None:
     resp = await client.get("/series/attendee-suggestions?q=a")
     assert resp.status_code == 200
     assert resp.text == ""
@@ -28,26 +38,24 @@ async def test_series_attendee_suggestions_requires_auth(client: AsyncClient) ->
     assert resp.status_code == 401
 
 
-async def test_series_attendee_suggestions_returns_matching_users(client: AsyncClient) -> None:
-    await login_user(
-        client, "teammate@example.com", "pw-teammate", first_name="Team", last_name="Mate"
-    )
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "alice@example.com", "pw-alice")
-
+async def test_series_attendee_suggestions_returns_matching_users(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
+) -> None:
+    await seed_users(db_session, "teammate@example.com", first_name="Team", last_name="Mate")
     resp = await client.get("/series/attendee-suggestions?q=team")
     assert resp.status_code == 200
     assert "teammate@example.com" in resp.text
     assert "alice@example.com" not in resp.text
 
 
-async def test_series_attendee_suggestions_uses_last_attendee_token(client: AsyncClient) -> None:
-    await login_user(
-        client, "teammate@example.com", "pw-teammate", first_name="Team", last_name="Mate"
-    )
-    await client.post("/logout", follow_redirects=True)
-    await login_user(client, "alice@example.com", "pw-alice")
-
+async def test_series_attendee_suggestions_uses_last_attendee_token(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
+) -> None:
+    await seed_users(db_session, "teammate@example.com", first_name="Team", last_name="Mate")
     resp = await client.get(
         "/series/attendee-suggestions",
         params={"attendee_emails": "first@example.com, tea"},
@@ -57,62 +65,57 @@ async def test_series_attendee_suggestions_uses_last_attendee_token(client: Asyn
 
 
 async def test_series_detail_handles_all_past_occurrences(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    alice_id: uuid.UUID,
 ) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    title = f"Past series {uuid.uuid4()}"
+    title = f"Past series {uid()}"
     resp = await client.post(
         "/series",
         data={
+            **DEFAULT_SERIES_FORM,
             "title": title,
-            "reminder_minutes_before": 60,
             "recurrence_start_date": "2000-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
             "generate_count": 2,
         },
-        follow_redirects=True,
+        follow_redirects=False,
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 303
 
-    alice = (
-        await db_session.execute(select(User).where(User.email == "alice@example.com"))
-    ).scalar_one()
-    series = (
-        await db_session.execute(
-            select(MeetingSeries).where(
-                MeetingSeries.owner_user_id == alice.id,
-                MeetingSeries.title == title,
-            )
-        )
-    ).scalar_one()
+    series = await get_series(db_session, owner_user_id=alice_id, title=title)
 
     detail = await client.get(f"/series/{series.id}")
     assert detail.status_code == 200
     assert title in detail.text
 
 
-async def test_series_recurrence_options_renders_mode_specific_controls(
-    client: AsyncClient,
-) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
+async def test_series_recurrence_options_renders_mode_specific_controls() -> None:
+    # Pure template render: call the view directly instead of going through the ASGI stack.
+    current_user = User(email="alice@example.com", first_name="Alice", timezone="UTC")
+    request = _build_request("/series/recurrence-options")
+
+    weekly = await series_recurrence_options(
+        request, recurrence_freq="WEEKLY", current_user=current_user
+    )
+    monthly = await series_recurrence_options(
+        request, recurrence_freq="MONTHLY", current_user=current_user
+    )
+    fallback = await series_recurrence_options(
+        request, recurrence_freq="UNKNOWN", current_user=current_user
+    )
 
-    weekly = await client.get("/series/recurrence-options?recurrence_freq=WEEKLY")
+    weekly_html = bytes(weekly.body).decode()
     assert weekly.status_code == 200
-    assert "Weekly days" in weekly.text
-    assert "monthly_bymonthday" not in weekly.text
+    assert "Weekly days" in weekly_html
+    assert "monthly_bymonthday" not in weekly_html
 
-    monthly = await client.get("/series/recurrence-options?recurrence_freq=MONTHLY")
+    monthly_html = bytes(monthly.body).decode()
     assert monthly.status_code == 200
-    assert "monthly_bymonthday" in monthly.text
-    assert "Weekly days" not in monthly.text
+    assert "monthly_bymonthday" in monthly_html
+    assert "Weekly days" not in monthly_html
 
-    fallback = await client.get("/series/recurrence-options?recurrence_freq=UNKNOWN")
     assert fallback.status_code == 200
-    assert "Daily recurrence does not require extra options." in fallback.text
+    assert "Daily recurrence does not require extra options." in bytes(fallback.body).decode()
 
 
 async def test_series_recurrence_options_requires_auth(client: AsyncClient) -> None:
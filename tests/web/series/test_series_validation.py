@@ -1,123 +1,86 @@
 from __future__ import annotations
 
+import asyncio
+import uuid
+from typing import NoReturn, cast
+
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
 
+from agendable.db.models import User
 from agendable.services.series_service import SeriesService
-from agendable.testing.web_test_helpers import login_user
-
-
-@pytest.mark.asyncio
-async def test_create_series_maps_service_value_error_to_bad_request(
-    client: AsyncClient,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    async def _raise_value_error(*args: object, **kwargs: object) -> tuple[object, list[object]]:
-        raise ValueError("service rejected series")
-
-    monkeypatch.setattr(SeriesService, "create_series_for_owner", _raise_value_error)
-
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Service Error",
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 1,
-        },
-    )
-
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "service rejected series"
-
-
-async def test_create_series_rejects_invalid_generate_count(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Invalid Count",
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 1,
-            "generate_count": 0,
-        },
-    )
-
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "generate_count must be between 1 and 200"
+from agendable.testing.web_test_helpers import DEFAULT_SERIES_FORM
+from agendable.web.routes.series import create_series
 
+_SERIES_FORM: dict[str, str | int] = {**DEFAULT_SERIES_FORM, "title": "Invalid series"}
 
-async def test_create_series_rejects_invalid_monthly_bymonthday(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Invalid Month Day",
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
+_INVALID_SERIES_CASES: tuple[tuple[dict[str, str | int], str], ...] = (
+    ({"generate_count": 0}, "generate_count must be between 1 and 200"),
+    ({"recurrence_interval": 0}, "recurrence_interval must be between 1 and 365"),
+    ({"recurrence_freq": "NOT_A_FREQ"}, "Invalid recurrence settings"),
+    (
+        {
             "recurrence_freq": "MONTHLY",
-            "recurrence_interval": 1,
             "monthly_mode": "monthday",
             "monthly_bymonthday": "not-a-number",
-            "generate_count": 1,
-        },
-    )
-
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "Invalid monthly day"
-
-
-async def test_create_series_rejects_invalid_recurrence_interval(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
-
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Invalid Interval",
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "DAILY",
-            "recurrence_interval": 0,
-            "generate_count": 1,
         },
-    )
-
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "recurrence_interval must be between 1 and 365"
-
+        "Invalid monthly day",
+    ),
+    (
+        {"reminder_minutes_before": -1},
+        "reminder_minutes_before must be between 0 and 43200",
+    ),
+    (
+        {"attendee_emails": "unknown@example.com"},
+        "Unknown attendee email(s): unknown@example.com",
+    ),
+)
+
+
+class _RejectingSeriesService:
+    async def create_series_for_owner(self, **kwargs: object) -> NoReturn:
+        raise ValueError("service rejected series")
 
-async def test_create_series_rejects_invalid_recurrence_settings(client: AsyncClient) -> None:
-    await login_user(client, "alice@example.com", "pw-alice")
 
-    resp = await client.post(
-        "/series",
-        data={
-            "title": "Invalid Rule",
-            "reminder_minutes_before": 60,
-            "recurrence_start_date": "2030-01-01",
-            "recurrence_time": "09:00",
-            "recurrence_timezone": "UTC",
-            "recurrence_freq": "NOT_A_FREQ",
-            "recurrence_interval": 1,
-            "generate_count": 1,
-        },
+@pytest.mark.asyncio
+async def test_create_series_maps_service_value_error_to_bad_request() -> None:
+    # Only the error mapping is under test, so call the view directly with a stub service.
+    with pytest.raises(HTTPException) as exc_info:
+        await create_series(
+            title="Service Error",
+            reminder_minutes_before=60,
+            recurrence_start_date="2030-01-01",
+            recurrence_time="09:00",
+            recurrence_timezone="UTC",
+            recurrence_freq="DAILY",
+            recurrence_interval=1,
+            weekly_byday=[],
+            monthly_mode="monthday",
+            monthly_bymonthday=None,
+            monthly_byday=None,
+            monthly_bysetpos=[],
+            attendee_emails="",
+            generate_count=1,
+            current_user=User(email="alice@example.com", first_name="Alice", timezone="UTC"),
+            series_service=cast(SeriesService, _RejectingSeriesService()),
+        )
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "service rejected series"
+
+
+async def test_create_series_rejects_invalid_inputs(
+    client: AsyncClient, alice_id: uuid.UUID
+) -> None:
+    # The cases are independent and read-only, so post them concurrently.
+    responses = await asyncio.gather(
+        *(
+            client.post("/series", data=_SERIES_FORM | overrides)
+            for overrides, _ in _INVALID_SERIES_CASES
+        )
     )
 
-    assert resp.status_code == 400
-    assert resp.json()["detail"] == "Invalid recurrence settings"
+    for resp, (overrides, expected_detail) in zip(responses, _INVALID_SERIES_CASES, strict=True):
+        assert resp.status_code == 400, overrides
+        assert resp.json()["detail"] == expected_detail, overrides
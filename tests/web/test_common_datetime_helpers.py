@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 import pytest
 from fastapi import HTTPException
 
-from agendable.datetime_utils import format_datetime_local_value
+from agendable.datetime_utils import format_datetime_local_value, get_zone
 from agendable.web.routes.common import (
     format_datetime_for_timezone,
     parse_dt,
@@ -49,16 +49,20 @@ def test_parse_dt_for_timezone_honors_timezone_aware_input() -> None:
     assert parsed == datetime(2030, 1, 1, 14, 0, tzinfo=UTC)
 
 
-def test_parse_timezone_rejects_blank() -> None:
-    with pytest.raises(HTTPException) as exc_info:
-        parse_timezone("   ")
-    assert exc_info.value.status_code == 400
-
-
-def test_parse_timezone_rejects_unknown() -> None:
+@pytest.mark.parametrize(
+    ("value", "detail"),
+    [
+        ("", "Invalid timezone"),
+        ("   ", "Invalid timezone"),
+        ("Mars/Phobos", "Unknown timezone"),
+        ("Bad/Zone", "Unknown timezone"),
+    ],
+)
+def test_parse_timezone_rejects_invalid(value: str, detail: str) -> None:
     with pytest.raises(HTTPException) as exc_info:
-        parse_timezone("Mars/Phobos")
+        parse_timezone(value)
     assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == detail
 
 
 def test_format_datetime_for_timezone_formats_with_zone() -> None:
@@ -67,6 +71,15 @@ def test_format_datetime_for_timezone_formats_with_zone() -> None:
     assert formatted == "2030-01-01 04:00 PM EST"
 
 
+def test_format_datetime_for_timezone_uses_twelve_hour_clock_at_midnight_and_noon() -> None:
+    assert format_datetime_for_timezone(datetime(2030, 1, 1, 0, 5, tzinfo=UTC), "UTC") == (
+        "2030-01-01 12:05 AM UTC"
+    )
+    assert format_datetime_for_timezone(datetime(2030, 1, 1, 12, 5, tzinfo=UTC), "UTC") == (
+        "2030-01-01 12:05 PM UTC"
+    )
+
+
 def test_format_datetime_for_timezone_returns_empty_for_non_datetime() -> None:
     assert format_datetime_for_timezone("2030-01-01", "UTC") == ""
 
@@ -89,6 +102,15 @@ def test_format_datetime_local_value_falls_back_to_utc_for_unknown_timezone() ->
     assert value == "2030-01-01T21:00"
 
 
+def test_get_zone_reuses_instances_and_caches_unknown_names() -> None:
+    assert get_zone("America/New_York") is get_zone("America/New_York")
+    assert get_zone("Unknown/Zone") is None
+
+    hits_before = get_zone.cache_info().hits
+    assert get_zone("Unknown/Zone") is None
+    assert get_zone.cache_info().hits == hits_before + 1
+
+
 def test_recurrence_label_defaults_when_rrule_missing() -> None:
     label = recurrence_label(
         recurrence_rrule=None,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import re
 import uuid
 from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import (
@@ -17,78 +17,77 @@ from agendable.db.models import (
     MeetingOccurrenceAttendee,
     MeetingSeries,
     Task,
-    User,
 )
-from agendable.testing.web_test_helpers import login_user
+from agendable.testing.web_test_helpers import LoginAs, authenticate_as, seed_users, uid
+
+# Shared time base for the module. Every fixture is offset by at least a
+# day, so the drift between import and the last test does not matter.
+NOW = datetime.now(UTC)
+
+_UPCOMING_OCCURRENCE_ID = re.compile(r'data-occurrence-id="([^"]+)"')
+
+
+def _upcoming_occurrence_ids(html: str) -> set[str]:
+    return set(_UPCOMING_OCCURRENCE_ID.findall(html))
 
 
 @pytest.mark.asyncio
 async def test_dashboard_shows_upcoming_and_tasks_ordered_by_due_date(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient, db_session: AsyncSession, login_as: LoginAs
 ) -> None:
-    await login_user(
-        client,
-        "dash-owner@example.com",
-        "pw-dash",
-        first_name="Dash",
-        last_name="User",
-    )
-
-    owner = (
-        await db_session.execute(select(User).where(User.email == "dash-owner@example.com"))
-    ).scalar_one()
+    owner_id = await login_as("dash-owner@example.com", first_name="Dash", last_name="User")
 
+    # Client-side ids let every row go out in a single flush.
     series = MeetingSeries(
-        owner_user_id=owner.id, title=f"Dash Series {uuid.uuid4()}", default_interval_days=7
+        id=uuid.uuid4(),
+        owner_user_id=owner_id,
+        title=f"Dash Series {uid()}",
+        default_interval_days=7,
     )
-    db_session.add(series)
-    await db_session.flush()
 
-    now = datetime.now(UTC)
+    now = NOW
     upcoming_1 = MeetingOccurrence(
-        series_id=series.id, scheduled_at=now + timedelta(days=1), notes=""
+        id=uuid.uuid4(), series_id=series.id, scheduled_at=now + timedelta(days=1), notes=""
     )
     upcoming_2 = MeetingOccurrence(
-        series_id=series.id, scheduled_at=now + timedelta(days=3), notes=""
+        id=uuid.uuid4(), series_id=series.id, scheduled_at=now + timedelta(days=3), notes=""
+    )
+    past = MeetingOccurrence(
+        id=uuid.uuid4(), series_id=series.id, scheduled_at=now - timedelta(days=2), notes=""
     )
-    past = MeetingOccurrence(series_id=series.id, scheduled_at=now - timedelta(days=2), notes="")
-    db_session.add_all([upcoming_1, upcoming_2, past])
-    await db_session.flush()
 
     later_due = Task(
         occurrence_id=upcoming_1.id,
-        assigned_user_id=owner.id,
+        assigned_user_id=owner_id,
         title="Later due",
         due_at=now + timedelta(days=5),
         is_done=False,
     )
     earlier_due = Task(
         occurrence_id=upcoming_2.id,
-        assigned_user_id=owner.id,
+        assigned_user_id=owner_id,
         title="Earlier due",
         due_at=now + timedelta(days=2),
         is_done=False,
     )
     done_task = Task(
         occurrence_id=upcoming_2.id,
-        assigned_user_id=owner.id,
+        assigned_user_id=owner_id,
         title="Done task",
         due_at=now + timedelta(days=1),
         is_done=True,
     )
-    db_session.add_all([later_due, earlier_due, done_task])
+    db_session.add_all([series, upcoming_1, upcoming_2, past, later_due, earlier_due, done_task])
     await db_session.commit()
 
     resp = await client.get("/dashboard")
     assert resp.status_code == 200
 
-    assert str(upcoming_1.id) in resp.text
-    assert str(upcoming_2.id) in resp.text
+    upcoming_ids = _upcoming_occurrence_ids(resp.text)
+    assert {str(upcoming_1.id), str(upcoming_2.id)} <= upcoming_ids
     assert str(past.id) not in resp.text
 
-    earlier_idx = resp.text.index("Earlier due")
-    later_idx = resp.text.index("Later due")
-    assert earlier_idx < later_idx
+    assert re.search(r"Earlier due[\s\S]*?Later due", resp.text) is not None
     assert "Done task" not in resp.text
 
 
@@ -96,59 +95,44 @@ async def test_dashboard_shows_upcoming_and_tasks_ordered_by_due_date(
 async def test_dashboard_shows_invited_meetings_and_tasks(
     client: AsyncClient, db_session: AsyncSession
 ) -> None:
-    await login_user(client, "owner@example.com", "pw-owner", first_name="Owner", last_name="One")
-    owner = (
-        await db_session.execute(select(User).where(User.email == "owner@example.com"))
-    ).scalar_one()
-
-    await client.post("/logout", follow_redirects=True)
-    await login_user(
-        client, "invited@example.com", "pw-invited", first_name="Invited", last_name="User"
-    )
-    invited = (
-        await db_session.execute(select(User).where(User.email == "invited@example.com"))
-    ).scalar_one()
+    # Both users go in with one INSERT; the client then signs in as the invitee.
+    user_ids = await seed_users(db_session, "owner@example.com", "invited@example.com")
+    owner_id, invited_id = user_ids["owner@example.com"], user_ids["invited@example.com"]
+    authenticate_as(client, invited_id)
 
     series = MeetingSeries(
-        owner_user_id=owner.id, title=f"Invite Series {uuid.uuid4()}", default_interval_days=7
+        id=uuid.uuid4(),
+        owner_user_id=owner_id,
+        title=f"Invite Series {uid()}",
+        default_interval_days=7,
     )
-    db_session.add(series)
-    await db_session.flush()
 
-    now = datetime.now(UTC)
+    now = NOW
     upcoming = MeetingOccurrence(
-        series_id=series.id, scheduled_at=now + timedelta(days=1), notes=""
-    )
-    db_session.add(upcoming)
-    await db_session.flush()
-
-    db_session.add(
-        MeetingOccurrenceAttendee(
-            occurrence_id=upcoming.id,
-            user_id=invited.id,
-        )
+        id=uuid.uuid4(), series_id=series.id, scheduled_at=now + timedelta(days=1), notes=""
     )
+    attendee = MeetingOccurrenceAttendee(occurrence_id=upcoming.id, user_id=invited_id)
 
     invited_task = Task(
         occurrence_id=upcoming.id,
-        assigned_user_id=owner.id,
+        assigned_user_id=owner_id,
         title="Invited task visibility",
         due_at=now + timedelta(days=2),
         is_done=False,
     )
     my_task = Task(
         occurrence_id=upcoming.id,
-        assigned_user_id=invited.id,
+        assigned_user_id=invited_id,
         title="Invited personal urgent task",
         due_at=now + timedelta(days=1),
         is_done=False,
     )
-    db_session.add_all([invited_task, my_task])
+    db_session.add_all([series, upcoming, attendee, invited_task, my_task])
     await db_session.commit()
 
     resp = await client.get("/dashboard")
     assert resp.status_code == 200
-    assert str(upcoming.id) in resp.text
+    assert str(upcoming.id) in _upcoming_occurrence_ids(resp.text)
     assert "Invited personal urgent task" in resp.text
     assert "Invited task visibility" in resp.text
 
@@ -165,96 +149,76 @@ async def test_dashboard_shows_invited_meetings_and_tasks(
 
 @pytest.mark.asyncio
 async def test_dashboard_labels_imported_upcoming_meetings(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient, db_session: AsyncSession, login_as: LoginAs
 ) -> None:
-    await login_user(
-        client,
-        "imported-owner@example.com",
-        "pw-imported",
-        first_name="Imported",
-        last_name="Owner",
+    owner_id = await login_as(
+        "imported-owner@example.com", first_name="Imported", last_name="Owner"
     )
-    owner = (
-        await db_session.execute(select(User).where(User.email == "imported-owner@example.com"))
-    ).scalar_one()
 
     series = MeetingSeries(
-        owner_user_id=owner.id,
-        title=f"Imported Series {uuid.uuid4()}",
+        id=uuid.uuid4(),
+        owner_user_id=owner_id,
+        title=f"Imported Series {uid()}",
         default_interval_days=7,
     )
-    db_session.add(series)
-    await db_session.flush()
 
-    now = datetime.now(UTC)
+    now = NOW
     occurrence = MeetingOccurrence(
+        id=uuid.uuid4(),
         series_id=series.id,
         scheduled_at=now + timedelta(days=1),
         notes="",
     )
-    db_session.add(occurrence)
-    await db_session.flush()
 
     connection = ExternalCalendarConnection(
-        user_id=owner.id,
+        id=uuid.uuid4(),
+        user_id=owner_id,
         provider=CalendarProvider.google,
         external_calendar_id="primary",
         access_token="token",
     )
-    db_session.add(connection)
-    await db_session.flush()
-
-    db_session.add(
-        ExternalCalendarEventMirror(
-            connection_id=connection.id,
-            linked_occurrence_id=occurrence.id,
-            external_event_id=f"evt-{uuid.uuid4()}",
-            summary="Imported Meeting",
-            start_at=occurrence.scheduled_at,
-            end_at=occurrence.scheduled_at + timedelta(minutes=30),
-            is_all_day=False,
-        )
+
+    mirror = ExternalCalendarEventMirror(
+        connection_id=connection.id,
+        linked_occurrence_id=occurrence.id,
+        external_event_id=f"evt-{uid()}",
+        summary="Imported Meeting",
+        start_at=occurrence.scheduled_at,
+        end_at=occurrence.scheduled_at + timedelta(minutes=30),
+        is_all_day=False,
     )
+    db_session.add_all([series, occurrence, connection, mirror])
     await db_session.commit()
 
     resp = await client.get("/dashboard")
     assert resp.status_code == 200
-    assert str(occurrence.id) in resp.text
+    assert str(occurrence.id) in _upcoming_occurrence_ids(resp.text)
     assert "(Imported)" in resp.text
 
 
 @pytest.mark.asyncio
 async def test_dashboard_hides_pending_imported_series(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient, db_session: AsyncSession, login_as: LoginAs
 ) -> None:
-    await login_user(
-        client,
-        "pending-owner@example.com",
-        "pw-pending",
-        first_name="Pending",
-        last_name="Owner",
-    )
-    owner = (
-        await db_session.execute(select(User).where(User.email == "pending-owner@example.com"))
-    ).scalar_one()
+    owner_id = await login_as("pending-owner@example.com", first_name="Pending", last_name="Owner")
 
     series = MeetingSeries(
-        owner_user_id=owner.id,
-        title=f"Pending Imported {uuid.uuid4()}",
+        id=uuid.uuid4(),
+        owner_user_id=owner_id,
+        title=f"Pending Imported {uid()}",
         default_interval_days=7,
         imported_from_provider=CalendarProvider.google,
-        import_external_series_id=f"master-{uuid.uuid4()}",
+        import_external_series_id=f"master-{uid()}",
         import_decision=ImportedSeriesDecision.pending,
     )
-    db_session.add(series)
-    await db_session.flush()
 
     occurrence = MeetingOccurrence(
+        id=uuid.uuid4(),
         series_id=series.id,
-        scheduled_at=datetime.now(UTC) + timedelta(days=1),
+        scheduled_at=NOW + timedelta(days=1),
         notes="",
     )
-    db_session.add(occurrence)
+    db_session.add_all([series, occurrence])
     await db_session.commit()
 
     resp = await client.get("/dashboard")
@@ -11,10 +11,11 @@ async def test_login_user_falls_back_to_login_for_existing_account(client: Async
     email = "helper-login@example.com"
     password = "pw-helper"
 
-    await login_user(client, email, password)
-    await client.post("/logout", follow_redirects=True)
+    signup_user_id = await login_user(client, email, password)
+    logout = await client.post("/logout", follow_redirects=False)
+    assert logout.status_code == 303
 
-    await login_user(client, email, password)
+    assert await login_user(client, email, password) == signup_user_id
 
     dashboard = await client.get("/dashboard")
     assert dashboard.status_code == 200